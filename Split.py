@@ -1,15 +1,625 @@
 import pandas as pd
+import numpy as np
 import os
-import math
+import re
+import posixpath
+import zipfile
+import itertools
+import io
+import threading
+import concurrent.futures
+from functools import partial
 from pathlib import Path
 
+# Copy-on-Write makes iloc slices safe read-only views (always on from pandas 3)
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.options.mode.copy_on_write = True
+
+# Input file extensions picked up from the folder
+INPUT_SUFFIXES = {'.xlsx', '.xls', '.csv'}
+
+# Buffer size for scanning and copying raw CSV bytes and for writing chunks
+BLOCK_SIZE = 1 << 20
+
+# Whitespace and newline bytes, which are all a blank CSV line can start with
+BLANK_BYTES = np.frombuffer(b' \t\r\n', dtype=np.uint8)
+
+# Bytes after which a quote opens a quoted CSV field (a quote after a
+# closing quote is an escaped "" pair)
+FIELD_START_BYTES = np.frombuffer(b',\n"', dtype=np.uint8)
+
+# Rust-backed xlsx writer, much faster than the pure-Python pandas engines
+try:
+    from rustpy_xlsxwriter import FastExcel
+except ImportError:
+    FastExcel = None
+
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
+
+# Arrow's C++ CSV writer, much faster than pandas' to_csv
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+# Arrow-backed columns keep strings in contiguous buffers instead of Python objects
+READ_OPTIONS = {'dtype_backend': 'pyarrow'} if pa is not None else {}
+
+# Excel readers: Rust calamine first (loads the sheet whole), openpyxl's streaming read-only mode second
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
+
+try:
+    import openpyxl
+except ImportError:
+    openpyxl = None
+
+def write_xlsx(chunk, output_path):
+    """
+    Write a DataFrame chunk to an xlsx file
+    
+    Args:
+        chunk (DataFrame): Rows to write
+        output_path (str): Destination xlsx file
+    """
+    if FastExcel is not None:
+        # Build the workbook in memory and write it out in one call. The frame
+        # goes through Arrow, which only takes text column names
+        buffer = io.BytesIO()
+        FastExcel(buffer).sheet("Sheet1", chunk.rename(columns=str)).save()
+        Path(output_path).write_bytes(buffer.getbuffer())
+    elif xlsxwriter is not None:
+        _write_xlsx_rows(chunk, output_path)
+    else:
+        chunk.to_excel(output_path, index=False)
+
+def _write_xlsx_rows(chunk, output_path):
+    """
+    Write a DataFrame chunk with xlsxwriter in constant memory mode
+    
+    Rows are streamed to disk as they are written instead of being kept
+    for the whole sheet. pandas' to_excel writes cells column by column,
+    which constant memory mode drops, so the rows are written directly.
+    
+    Args:
+        chunk (DataFrame): Rows to write
+        output_path (str): Destination xlsx file
+    """
+    workbook = xlsxwriter.Workbook(str(output_path), {
+        'constant_memory': True,
+        'default_date_format': 'yyyy-mm-dd hh:mm:ss',
+        'nan_inf_to_errors': True,
+        'remove_timezone': True,
+    })
+    
+    try:
+        worksheet = workbook.add_worksheet("Sheet1")
+        worksheet.write_row(0, 0, list(chunk.columns))
+        
+        # Missing values become None, which xlsxwriter leaves as empty cells
+        values = chunk.to_numpy(dtype=object)
+        values[pd.isna(values)] = None
+        for row_num, row in enumerate(values, start=1):
+            worksheet.write_row(row_num, 0, row)
+    finally:
+        workbook.close()
+
+def write_csv(chunk, output_path):
+    """
+    Write a DataFrame chunk to a CSV file
+    
+    Args:
+        chunk (DataFrame): Rows to write
+        output_path (str): Destination CSV file
+    """
+    if pa is not None:
+        # Arrow writes booleans as true/false, keep pandas' True/False text. The
+        # Excel readers leave a boolean column with blanks as Python objects
+        bool_columns = {
+            name: 'string' for name, column in chunk.items()
+            if pd.api.types.is_bool_dtype(column.dtype)
+            or (column.dtype == object and pd.api.types.infer_dtype(column, skipna=True) == 'boolean')
+        }
+        if bool_columns:
+            chunk = chunk.astype(bool_columns)
+        
+        # Convert before opening the file so a failed chunk leaves no empty file behind
+        table = _to_arrow_table(chunk)
+        with pa.output_stream(str(output_path), compression=None, buffer_size=BLOCK_SIZE) as sink:
+            pacsv.write_csv(table, sink)
+        return
+    
+    with open(output_path, 'w', newline='', encoding='utf-8', buffering=BLOCK_SIZE) as f:
+        chunk.to_csv(f, index=False)
+
+def write_parquet(chunk, output_path, schema=None):
+    """
+    Write a DataFrame chunk to a zstd-compressed Parquet file
+    
+    With a schema the chunk is cast to it, so all the parts of a file share
+    one schema. A chunk holding values the schema cannot take, such as text
+    in a column that was numeric in the first chunk, keeps its own types.
+    
+    Args:
+        chunk (DataFrame): Rows to write
+        output_path (str): Destination Parquet file
+        schema (pa.Schema): Column types shared by the parts of a file (default: None)
+    """
+    table = _to_arrow_table(chunk)
+    if schema is not None:
+        try:
+            table = table.cast(schema)
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            # The values do not fit the shared types, keep this chunk's own
+            pass
+    pq.write_table(table, str(output_path), compression='zstd')
+
+def _parquet_schema(chunk):
+    """
+    Build the Arrow schema the Parquet parts of a file are written with
+    
+    Columns that are empty in the first chunk have no type yet, so they
+    are stored as text, which any later value can be cast to. The pandas
+    metadata is dropped as it records the first chunk's dtypes.
+    
+    Args:
+        chunk (DataFrame): First chunk of the file
+    """
+    schema = _to_arrow_table(chunk).schema.remove_metadata()
+    for i, field in enumerate(schema):
+        if pa.types.is_null(field.type):
+            schema = schema.set(i, field.with_type(pa.string()))
+    return schema
+
+def _to_arrow_table(chunk):
+    """
+    Convert a DataFrame chunk to an Arrow table
+    
+    Args:
+        chunk (DataFrame): Rows to convert
+    """
+    try:
+        # Chunks are already written in parallel, so convert on this thread only
+        return pa.Table.from_pandas(chunk, preserve_index=False, nthreads=1)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+        # Mixed-type object columns and integers past int64 have no Arrow
+        # type, write them as text so the rest of the chunk keeps its types
+        text_columns = {name: 'string' for name in chunk.select_dtypes(include='object').columns}
+        return pa.Table.from_pandas(chunk.astype(text_columns), preserve_index=False, nthreads=1)
+
+def _convert_calamine_cell(value):
+    """
+    Convert a calamine cell value to what pd.read_excel gives for it
+    
+    Args:
+        value: Cell value returned by calamine
+    """
+    # calamine returns every number as a float and empty cells as ''
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if value == '':
+        return None
+    return value
+
+def _dedup_columns(names):
+    """
+    Rename repeated column names to name.1, name.2, ... like read_excel does
+    
+    Args:
+        names (list): Column names from the header row
+    """
+    counts = {}
+    columns = []
+    for name in names:
+        count = counts.get(name, 0)
+        # Keep counting past a renamed column that is already taken
+        while count:
+            counts[name] = count + 1
+            name = f"{name}.{count}"
+            count = counts.get(name, 0)
+        counts[name] = count + 1
+        columns.append(name)
+    return columns
+
+def _excel_row_count(file_path):
+    """
+    Read the number of data rows in an Excel file's first sheet from its dimension record
+    
+    Only the workbook index and the start of the sheet XML are read, so the
+    shared strings and cells are never parsed. Returns None when the count
+    cannot be read this way.
+    
+    Args:
+        file_path (Path): Excel file to inspect
+    """
+    if file_path.suffix.lower() != '.xlsx':
+        return None
+    
+    try:
+        with zipfile.ZipFile(file_path) as archive:
+            # Follow the first sheet's relationship id to its XML part
+            sheet = re.search(rb'<(?:\w+:)?sheet\b[^>]*?\b\w+:id="([^"]+)"', archive.read('xl/workbook.xml'))
+            if sheet is None:
+                return None
+            
+            target = None
+            for rel in re.finditer(rb'<(?:\w+:)?Relationship\b[^>]*>', archive.read('xl/_rels/workbook.xml.rels')):
+                if re.search(rb'\bId="' + re.escape(sheet.group(1)) + rb'"', rel.group(0)):
+                    target = re.search(rb'\bTarget="([^"]+)"', rel.group(0))
+                    break
+            if target is None:
+                return None
+            
+            target = target.group(1).decode()
+            sheet_path = target.lstrip('/') if target.startswith('/') else posixpath.normpath('xl/' + target)
+            
+            # The dimension record comes before the cells, near the start of the sheet
+            with archive.open(sheet_path) as f:
+                head = f.read(1 << 16)
+    except (OSError, KeyError, zipfile.BadZipFile):
+        return None
+    
+    dimension = re.search(rb'<(?:\w+:)?dimension\b[^>]*?\bref="[A-Z]+(\d+):[A-Z]+(\d+)"', head)
+    
+    # Some writers leave a placeholder "A1" dimension, which says nothing about the rows
+    if dimension is None:
+        return None
+    return int(dimension.group(2)) - int(dimension.group(1))
+
+def _iter_excel_chunks(file_path, chunk_size):
+    """
+    Yield the first sheet of an Excel file as DataFrames of chunk_size rows
+    
+    calamine reads the whole sheet into memory up front but converts it to
+    DataFrames one chunk at a time. Without calamine, .xlsx rows are
+    streamed with openpyxl's read-only mode so only one chunk is held in
+    memory, and any other file is loaded whole with pandas.
+    
+    Args:
+        file_path (Path): Excel file to read
+        chunk_size (int): Number of rows per chunk
+    """
+    if CalamineWorkbook is not None:
+        workbook = CalamineWorkbook.from_path(str(file_path))
+        rows = ([_convert_calamine_cell(cell) for cell in row]
+                for row in workbook.get_sheet_by_index(0).iter_rows())
+    elif openpyxl is not None and file_path.suffix.lower() == '.xlsx':
+        workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+    else:
+        # No streaming reader for this file, load the whole sheet and slice it
+        df = pd.read_excel(file_path, **READ_OPTIONS)
+        for start_row in range(0, len(df), chunk_size):
+            yield df.iloc[start_row:start_row + chunk_size]
+        return
+    
+    try:
+        header = next(rows, None)
+        if header is None:
+            return
+        
+        columns = _dedup_columns([f"Unnamed: {j}" if name in (None, '') else name for j, name in enumerate(header)])
+        
+        # Skip blank rows like read_excel does
+        rows = (row for row in rows if any(cell not in (None, '') for cell in row))
+        
+        while True:
+            batch = list(itertools.islice(rows, chunk_size))
+            if not batch:
+                break
+            yield pd.DataFrame(batch, columns=columns)
+    finally:
+        workbook.close()
+
+def iter_chunks(file_path, chunk_size):
+    """
+    Yield an Excel/CSV file as DataFrames of chunk_size rows
+    
+    The file is read and handed out one chunk at a time, so the whole
+    file is never held in memory.
+    
+    Args:
+        file_path (Path): Excel/CSV file to read
+        chunk_size (int): Number of rows per chunk
+    """
+    # Read file based on extension
+    if file_path.suffix.lower() == '.csv':
+        with pd.read_csv(file_path, chunksize=chunk_size, **READ_OPTIONS) as reader:
+            yield from reader
+    else:
+        yield from _iter_excel_chunks(file_path, chunk_size)
+
+def _csv_chunk_offsets(file_path, chunk_size):
+    """
+    Find the byte offsets at which each chunk_size row chunk of a CSV file starts
+    
+    Newlines inside quoted fields do not end a row, and blank lines are not
+    counted, as read_csv skips them. The first offset is the end of the
+    header line and the last one is the end of the file.
+    
+    Args:
+        file_path (Path): CSV file to scan
+        chunk_size (int): Number of rows per chunk
+    
+    Returns:
+        tuple: (list of byte offsets, number of data rows), or (None, None)
+        when the file has quotes or line endings that read_csv splits differently
+    """
+    offsets = []
+    rows = -1 # the header is row 0
+    in_quotes = False
+    position = 0
+    last_byte = b'\n'
+    pending_text = False # the unfinished last line has non-blank text
+    
+    with open(file_path, 'rb') as f:
+        while True:
+            buf = f.read(BLOCK_SIZE)
+            if not buf:
+                break
+            
+            # read_csv also ends a row at a lone \r, which this scan does not follow
+            if (last_byte == b'\r' and buf[:1] != b'\n') or buf.count(b'\r') - buf.count(b'\r\n') - buf.endswith(b'\r'):
+                return None, None
+            
+            data = np.frombuffer(buf, dtype=np.uint8)
+            row_ends = np.flatnonzero(data == ord('\n'))
+            
+            if in_quotes or b'"' in buf:
+                # A newline only ends a row when an even number of quotes precede it
+                # (only the parity matters, so a wrapping uint8 count is enough)
+                is_quote = data == ord('"')
+                quotes = np.cumsum(is_quote, dtype=np.uint8)
+                
+                # read_csv only opens a quoted field at the start of a field, any
+                # other quote is literal text that the parity count cannot follow
+                quote_at = np.flatnonzero(is_quote)
+                opening = quote_at[(quotes[quote_at] + in_quotes) % 2 == 1]
+                before = np.where(opening > 0, data[opening - 1], last_byte[0])
+                if not np.isin(before, FIELD_START_BYTES).all():
+                    return None, None
+                
+                row_ends = row_ends[(quotes[row_ends] + in_quotes) % 2 == 0]
+                in_quotes = bool((quotes[-1] + in_quotes) % 2)
+            
+            if len(row_ends):
+                # Only a line starting with whitespace or a newline can be blank
+                starts = np.concatenate(([0], row_ends[:-1] + 1))
+                candidates = np.flatnonzero(np.isin(data[starts], BLANK_BYTES))
+                blank = [i for i in candidates.tolist() if not buf[starts[i]:row_ends[i]].strip(b' \t\r')]
+                if blank and blank[0] == 0 and pending_text:
+                    blank.pop(0)
+                pending_text = bool(buf[row_ends[-1] + 1:].strip(b' \t\r'))
+                row_ends = np.delete(row_ends, blank)
+            else:
+                pending_text = pending_text or bool(buf.strip(b' \t\r'))
+            
+            # Keep every chunk_size-th row end, counting on from the previous buffer
+            first = -(rows + 1) % chunk_size
+            offsets.extend((row_ends[first::chunk_size] + position + 1).tolist())
+            
+            rows += len(row_ends)
+            position += len(buf)
+            last_byte = buf[-1:]
+    
+    # Last row without a trailing newline
+    if pending_text:
+        rows += 1
+    
+    if offsets and not pending_text and rows % chunk_size == 0:
+        # The last row closed a chunk, so trailing blank lines belong to it
+        offsets[-1] = position
+    elif not offsets or offsets[-1] != position:
+        offsets.append(position)
+    
+    return offsets, max(rows, 0)
+
+def _split_csv_bytes(file_path, offsets, total_rows, chunk_size, folder, part_label='part'):
+    """
+    Split a CSV file into CSV chunks by copying raw bytes, without parsing values
+    
+    Args:
+        file_path (Path): CSV file to split
+        offsets (list): Chunk byte offsets from _csv_chunk_offsets
+        total_rows (int): Number of data rows in the file
+        chunk_size (int): Number of rows per chunk
+        folder (Path): Folder the chunk files are written to
+        part_label (str): Label used in chunk file names (default: 'part')
+    """
+    print(f"Creating {len(offsets) - 1} chunks...")
+    
+    # Build the file name prefix once, each chunk only adds its number
+    prefix = str(folder / f"{file_path.stem}_{part_label}_")
+    buffer = memoryview(bytearray(BLOCK_SIZE))
+    
+    with open(file_path, 'rb', buffering=0) as src:
+        header = src.read(offsets[0])
+        
+        for i, (start, end) in enumerate(zip(offsets, offsets[1:])):
+            output_path = f"{prefix}{i+1:02d}.csv"
+            
+            with open(output_path, 'wb', buffering=BLOCK_SIZE) as dst:
+                dst.write(header)
+                remaining = end - start
+                while remaining > 0:
+                    n = src.readinto(buffer[:min(remaining, BLOCK_SIZE)])
+                    if not n:
+                        break
+                    dst.write(buffer[:n])
+                    remaining -= n
+            
+            print(f" Created: {os.path.basename(output_path)} ({min(chunk_size, total_rows - i * chunk_size)} rows)")
+    
+    print(f"âœ“ Successfully split {file_path.name}")
+
+# Chunk writer for each output format, looked up once per file
+CHUNK_WRITERS = {
+    'xlsx': write_xlsx,
+    'csv': write_csv,
+    'parquet': write_parquet,
+}
+
+def _find_input_files(folder):
+    """
+    List the Excel and CSV files in a folder, largest first
+    
+    Args:
+        folder (Path): Folder to search
+    """
+    # One directory scan, skipping folders and Excel's "~$" lock files
+    with os.scandir(folder) as entries:
+        files = [
+            entry for entry in entries
+            if entry.is_file(follow_symlinks=False)
+            and not entry.name.startswith('~$')
+            and os.path.splitext(entry.name)[1].lower() in INPUT_SUFFIXES
+        ]
+    
+    # Start the largest files first so the worker processes stay evenly loaded
+    files.sort(key=lambda entry: entry.stat(follow_symlinks=False).st_size, reverse=True)
+    return [Path(entry.path) for entry in files]
+
+def _process_file(file_path, chunk_size, output_format, folder, part_label='part', write_threads=1):
+    """
+    Split a single Excel/CSV file into chunk_size row chunks
+    
+    Args:
+        file_path (Path): File to split
+        chunk_size (int): Number of rows per chunk
+        output_format (str): Output format - 'xlsx', 'csv' or 'parquet'
+        folder (Path): Folder the chunk files are written to
+        part_label (str): Label used in chunk file names (default: 'part')
+        write_threads (int): Number of threads writing chunks (default: 1)
+    """
+    print(f"\nProcessing: {file_path.name}")
+    
+    try:
+        is_csv = file_path.suffix.lower() == '.csv'
+        
+        # Every CSV row takes at least two bytes, so a file this small cannot need splitting
+        if is_csv and file_path.stat().st_size <= 2 * chunk_size:
+            print(f"File is too small to have more than {chunk_size} rows. No splitting needed.")
+            return
+        
+        # Count rows up front so a file that needs no splitting is never parsed
+        if is_csv:
+            offsets, total_rows = _csv_chunk_offsets(file_path, chunk_size)
+        else:
+            offsets, total_rows = None, _excel_row_count(file_path)
+        
+        if total_rows is not None:
+            print(f"Total rows: {total_rows}")
+            
+            # Skip if file has fewer rows than chunk size
+            if total_rows <= chunk_size:
+                print(f"File has {total_rows} rows, which is <= chunk size ({chunk_size}). No splitting needed.")
+                return
+        
+        # CSV to CSV needs no parsing, copy the raw bytes of each chunk instead
+        if is_csv and output_format == 'csv' and offsets is not None:
+            _split_csv_bytes(file_path, offsets, total_rows, chunk_size, folder, part_label)
+            return
+        
+        chunks = iter_chunks(file_path, chunk_size)
+        first_chunk = next(chunks, None)
+        second_chunk = next(chunks, None)
+        
+        if second_chunk is None:
+            total_rows = 0 if first_chunk is None else len(first_chunk)
+            print(f"Total rows: {total_rows}")
+            print(f"File has {total_rows} rows, which is <= chunk size ({chunk_size}). No splitting needed.")
+            return
+        
+        print("Streaming chunks...")
+        
+        # Resolve the file name prefix, extension and writer once per file
+        prefix = str(folder / f"{file_path.stem}_{part_label}_")
+        ext = f".{output_format}"
+        write_chunk = CHUNK_WRITERS[output_format]
+        if output_format == 'parquet':
+            # Cast every part to the first chunk's types so they read back as one dataset
+            write_chunk = partial(write_chunk, schema=_parquet_schema(first_chunk))
+        
+        chunks = itertools.chain([first_chunk, second_chunk], chunks)
+        del first_chunk, second_chunk
+        
+        # Hand each chunk to a writer thread while the next one is being read
+        write_slots = threading.BoundedSemaphore(write_threads)
+        written = []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=write_threads) as executor:
+            for i, chunk in enumerate(chunks):
+                output_path = f"{prefix}{i+1:02d}{ext}"
+                
+                # Cap the chunks in flight so reading cannot outrun the writers
+                write_slots.acquire()
+                future = executor.submit(write_chunk, chunk, output_path)
+                future.add_done_callback(lambda _: write_slots.release())
+                written.append((output_path, len(chunk), future))
+                
+                # Drop our reference so a written chunk is freed right away
+                del chunk
+        
+        for output_path, rows, future in written:
+            future.result()
+            print(f" Created: {os.path.basename(output_path)} ({rows} rows)")
+        
+        print(f"âœ“ Successfully split {file_path.name}")
+        
+    except Exception as e:
+        print(f"âœ— Error processing {file_path.name}: {e}")
+
+def _writer_releases_gil(output_format):
+    """
+    Check whether chunks in this output format are written outside the GIL
+    
+    Args:
+        output_format (str): Output format - 'xlsx', 'csv' or 'parquet'
+    """
+    if output_format == 'xlsx':
+        return FastExcel is not None
+    return pa is not None
+
+def _process_files(files_to_process, chunk_size, output_format, folder, part_label='part'):
+    """
+    Split every file in parallel, one worker process per file
+    
+    Args:
+        files_to_process (list): Files to split
+        chunk_size (int): Number of rows per chunk
+        output_format (str): Output format - 'xlsx', 'csv' or 'parquet'
+        folder (Path): Folder the chunk files are written to
+        part_label (str): Label used in chunk file names (default: 'part')
+    """
+    # Processes rather than threads: the xlsx engines hold the GIL while serializing
+    cpu_count = os.cpu_count() or 1
+    max_workers = min(cpu_count, len(files_to_process))
+    
+    # Extra writer threads only pay off when the writer works outside the GIL;
+    # share the remaining cores out between the processes without oversubscribing
+    if _writer_releases_gil(output_format):
+        write_threads = max(1, cpu_count // max_workers)
+    else:
+        write_threads = 1
+    
+    worker = partial(_process_file, chunk_size=chunk_size, output_format=output_format,
+                     folder=folder, part_label=part_label, write_threads=write_threads)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(worker, files_to_process))
+
 def split_excel_csv_to_10k_rows(folder_path, output_format='xlsx'):
     """
     Split Excel/CSV files in a folder into 10,000 row chunks
     
     Args:
         folder_path (str): Path to folder containing Excel/CSV files
-        output_format (str): Output format - 'xlsx' or 'csv' (default: 'xlsx')
+        output_format (str): Output format - 'xlsx', 'csv' or 'parquet' (default: 'xlsx')
     """
     
     folder = Path(folder_path)
@@ -20,18 +630,18 @@ def split_excel_csv_to_10k_rows(folder_path, output_format='xlsx'):
         return
     
     # Validate output format
-    if output_format.lower() not in ['xlsx', 'csv']:
-        print("Error: Output format must be 'xlsx' or 'csv'")
+    if output_format.lower() not in CHUNK_WRITERS:
+        print("Error: Output format must be 'xlsx', 'csv' or 'parquet'")
         return
     
     output_format = output_format.lower()
     
-    # Find all Excel and CSV files
-    file_patterns = ['*.xlsx', '*.xls', '*.csv']
-    files_to_process = []
+    if output_format == 'parquet' and pa is None:
+        print("Error: Parquet output needs pyarrow, which is not installed")
+        return
     
-    for pattern in file_patterns:
-        files_to_process.extend(folder.glob(pattern))
+    # Find all Excel and CSV files
+    files_to_process = _find_input_files(folder)
     
     if not files_to_process:
         print("No Excel or CSV files found in the folder!")
@@ -40,53 +650,7 @@ def split_excel_csv_to_10k_rows(folder_path, output_format='xlsx'):
     print(f"Found {len(files_to_process)} file(s) to process")
     print(f"Output format: {output_format.upper()}")
     
-    for file_path in files_to_process:
-        print(f"\nProcessing: {file_path.name}")
-        
-        try:
-            # Read file based on extension
-            if file_path.suffix.lower() == '.csv':
-                df = pd.read_csv(file_path)
-            else:
-                df = pd.read_excel(file_path)
-            
-            total_rows = len(df)
-            print(f"Total rows: {total_rows}")
-            
-            # Skip if file has 10k or fewer rows
-            if total_rows <= 10000:
-                print("File has 10,000 or fewer rows. No splitting needed.")
-                continue
-            
-            # Calculate number of chunks
-            num_chunks = math.ceil(total_rows / 10000)
-            base_name = file_path.stem
-            
-            print(f"Creating {num_chunks} chunks...")
-            
-            # Create chunks
-            for i in range(num_chunks):
-                start_row = i * 10000
-                end_row = min((i + 1) * 10000, total_rows)
-                
-                chunk = df.iloc[start_row:end_row].copy()
-                
-                # Create output filename based on format
-                if output_format == 'xlsx':
-                    output_name = f"{base_name}_chunk_{i+1:02d}.xlsx"
-                    output_path = folder / output_name
-                    chunk.to_excel(output_path, index=False)
-                else: # csv
-                    output_name = f"{base_name}_chunk_{i+1:02d}.csv"
-                    output_path = folder / output_name
-                    chunk.to_csv(output_path, index=False)
-                
-                print(f" Created: {output_name} ({len(chunk)} rows)")
-            
-            print(f"âœ“ Successfully split {file_path.name}")
-            
-        except Exception as e:
-            print(f"âœ— Error processing {file_path.name}: {e}")
+    _process_files(files_to_process, 10000, output_format, folder, part_label='chunk')
 
 def split_with_custom_chunk_size(folder_path, chunk_size=10000, output_format='xlsx'):
     """
@@ -95,7 +659,7 @@ def split_with_custom_chunk_size(folder_path, chunk_size=10000, output_format='x
     Args:
         folder_path (str): Path to folder containing Excel/CSV files
         chunk_size (int): Number of rows per chunk (default: 10000)
-        output_format (str): Output format - 'xlsx' or 'csv' (default: 'xlsx')
+        output_format (str): Output format - 'xlsx', 'csv' or 'parquet' (default: 'xlsx')
     """
     
     folder = Path(folder_path)
@@ -105,18 +669,18 @@ def split_with_custom_chunk_size(folder_path, chunk_size=10000, output_format='x
         return
     
     # Validate output format
-    if output_format.lower() not in ['xlsx', 'csv']:
-        print("Error: Output format must be 'xlsx' or 'csv'")
+    if output_format.lower() not in CHUNK_WRITERS:
+        print("Error: Output format must be 'xlsx', 'csv' or 'parquet'")
         return
     
     output_format = output_format.lower()
     
-    # Find all Excel and CSV files
-    file_patterns = ['*.xlsx', '*.xls', '*.csv']
-    files_to_process = []
+    if output_format == 'parquet' and pa is None:
+        print("Error: Parquet output needs pyarrow, which is not installed")
+        return
     
-    for pattern in file_patterns:
-        files_to_process.extend(folder.glob(pattern))
+    # Find all Excel and CSV files
+    files_to_process = _find_input_files(folder)
     
     if not files_to_process:
         print("No Excel or CSV files found in the folder!")
@@ -126,67 +690,23 @@ def split_with_custom_chunk_size(folder_path, chunk_size=10000, output_format='x
     print(f"Using chunk size: {chunk_size} rows")
     print(f"Output format: {output_format.upper()}")
     
-    for file_path in files_to_process:
-        print(f"\nProcessing: {file_path.name}")
-        
-        try:
-            # Read file based on extension
-            if file_path.suffix.lower() == '.csv':
-                df = pd.read_csv(file_path)
-            else:
-                df = pd.read_excel(file_path)
-            
-            total_rows = len(df)
-            print(f"Total rows: {total_rows}")
-            
-            # Skip if file has fewer rows than chunk size
-            if total_rows <= chunk_size:
-                print(f"File has {total_rows} rows, which is <= chunk size ({chunk_size}). No splitting needed.")
-                continue
-            
-            # Calculate number of chunks
-            num_chunks = math.ceil(total_rows / chunk_size)
-            base_name = file_path.stem
-            
-            print(f"Creating {num_chunks} chunks...")
-            
-            # Create chunks
-            for i in range(num_chunks):
-                start_row = i * chunk_size
-                end_row = min((i + 1) * chunk_size, total_rows)
-                
-                chunk = df.iloc[start_row:end_row].copy()
-                
-                # Create output filename based on format
-                if output_format == 'xlsx':
-                    output_name = f"{base_name}_part_{i+1:02d}.xlsx"
-                    output_path = folder / output_name
-                    chunk.to_excel(output_path, index=False)
-                else: # csv
-                    output_name = f"{base_name}_part_{i+1:02d}.csv"
-                    output_path = folder / output_name
-                    chunk.to_csv(output_path, index=False)
-                
-                print(f" Created: {output_name} ({len(chunk)} rows)")
-            
-            print(f"âœ“ Successfully split {file_path.name}")
-            
-        except Exception as e:
-            print(f"âœ— Error processing {file_path.name}: {e}")
+    _process_files(files_to_process, chunk_size, output_format, folder)
 
 def get_output_format_choice():
     """
     Get output format choice from user
     """
     while True:
-        choice = input("Choose output format (1 for XLSX, 2 for CSV): ").strip()
+        choice = input("Choose output format (1 for XLSX, 2 for CSV, 3 for Parquet): ").strip()
         
         if choice == '1':
             return 'xlsx'
         elif choice == '2':
             return 'csv'
+        elif choice == '3':
+            return 'parquet'
         else:
-            print("Invalid choice. Please enter 1 for XLSX or 2 for CSV.")
+            print("Invalid choice. Please enter 1 for XLSX, 2 for CSV or 3 for Parquet.")
 
 def main():
     """
@@ -205,6 +725,7 @@ def main():
     print("\nSelect output format:")
     print("1. XLSX (Excel format)")
     print("2. CSV (Comma-separated values)")
+    print("3. Parquet (Compressed columnar format)")
     output_format = get_output_format_choice()
     
     # Ask for chunk size